@@ -3,14 +3,12 @@ Streamlit Web Application for Price Elasticity Analysis
 Interactive deployment of the price elasticity model
 """
 
+import io
 import streamlit as st
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
+import altair as alt
 from price_elasticity_model import PriceElasticityModel
-import warnings
-warnings.filterwarnings('ignore')
 
 # Page configuration
 st.set_page_config(
@@ -39,11 +37,89 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
+# Cached pipeline: reruns with the same file and settings reuse the result.
+# The caches are shared by every session, so they are bounded in size and age
+@st.cache_data(show_spinner=False, max_entries=8, ttl=3600)
+def load_model(file_bytes, price_col, sales_col, category_col):
+    """Load and preprocess uploaded data into a fresh model"""
+    model = PriceElasticityModel()
+    load_info = model.load_data(
+        io.BytesIO(file_bytes),
+        price_col=price_col,
+        sales_col=sales_col,
+        category_col=category_col
+    )
+    return model, load_info
+
+
+@st.cache_data(show_spinner=False, max_entries=16, ttl=3600)
+def run_analysis(file_bytes, price_col, sales_col, category_col, min_observations):
+    """Calculate elasticity on top of the cached loaded model"""
+    model, _ = load_model(file_bytes, price_col, sales_col, category_col)
+    model.calculate_elasticity(min_observations=min_observations)
+    return model
+
+
+@st.cache_data(show_spinner=False, max_entries=16, ttl=3600)
+def overview_counts(results):
+    """Demand type and price increase counts for the overview pies"""
+    return results['demand_type'].value_counts(), results['can_increase_price'].value_counts()
+
+
+# Charts are built as Vega-Lite specs and rendered in the browser
+@st.cache_data(show_spinner=False, max_entries=16, ttl=3600)
+def elasticity_chart_spec(results):
+    """Horizontal bar chart of elasticity by category with the unit-elastic line"""
+    bars = alt.Chart(results).mark_bar(opacity=0.8).encode(
+        x=alt.X('elasticity:Q', title='Price Elasticity Coefficient'),
+        y=alt.Y('category:N', sort=None, title='Product Category'),
+        color=alt.condition(
+            alt.datum.elasticity < 1, alt.value('#27ae60'), alt.value('#e74c3c')
+        ),
+        tooltip=['category', alt.Tooltip('elasticity:Q', format='.3f'), 'demand_type']
+    )
+    unit_elastic = alt.Chart(pd.DataFrame({'elasticity': [1]})).mark_rule(
+        color='black', strokeDash=[6, 4], strokeWidth=2
+    ).encode(x='elasticity:Q')
+    
+    return (bars + unit_elastic).properties(
+        height=max(400, 25 * len(results)),
+        title=alt.TitleParams(
+            'Price Elasticity by Product Category',
+            subtitle='Green = Price Increase Opportunity | Red = Price Sensitive | '
+                     'Dashed line = Unit Elastic (E = 1)'
+        )
+    ).to_dict()
+
+
+@st.cache_data(show_spinner=False, max_entries=32, ttl=3600)
+def pie_chart_spec(counts, title, colors=None):
+    """Pie chart of value counts with percentage labels"""
+    data = pd.DataFrame({'label': counts.index.astype(str), 'count': counts.values})
+    data['share'] = data['count'] / data['count'].sum()
+    
+    if colors:
+        scale = alt.Scale(domain=list(colors.keys()), range=list(colors.values()))
+    else:
+        scale = alt.Scale()
+    
+    base = alt.Chart(data).encode(
+        theta=alt.Theta('count:Q', stack=True),
+        color=alt.Color('label:N', title=None, scale=scale),
+        tooltip=['label', 'count', alt.Tooltip('share:Q', format='.1%')]
+    )
+    pie = base.mark_arc(outerRadius=120)
+    labels = base.mark_text(radius=145).encode(text=alt.Text('share:Q', format='.1%'))
+    
+    return (pie + labels).properties(height=350, title=title).to_dict()
+
+
 # Initialize session state
 if 'model' not in st.session_state:
     st.session_state.model = PriceElasticityModel()
     st.session_state.data_loaded = False
     st.session_state.analysis_done = False
+    st.session_state.simulations = {}
 
 # Title
 st.markdown('<h1 class="main-header">📊 Price Elasticity Analysis Dashboard</h1>', 
@@ -80,11 +156,11 @@ if uploaded_file is not None:
     if not st.session_state.data_loaded:
         with st.spinner("Loading and preprocessing data..."):
             try:
-                load_info = st.session_state.model.load_data(
-                    uploaded_file,
-                    price_col=price_col,
-                    sales_col=sales_col,
-                    category_col=category_col
+                st.session_state.model, load_info = load_model(
+                    uploaded_file.getvalue(),
+                    price_col,
+                    sales_col,
+                    category_col
                 )
                 st.session_state.data_loaded = True
                 st.success(f"✅ Data loaded successfully! ({load_info['cleaned_size']:,} records)")
@@ -97,10 +173,15 @@ if uploaded_file is not None:
         if st.button("🚀 Run Price Elasticity Analysis", type="primary"):
             with st.spinner("Calculating price elasticity by category..."):
                 try:
-                    results = st.session_state.model.calculate_elasticity(
-                        min_observations=min_observations
+                    st.session_state.model = run_analysis(
+                        uploaded_file.getvalue(),
+                        price_col,
+                        sales_col,
+                        category_col,
+                        min_observations
                     )
                     st.session_state.analysis_done = True
+                    st.session_state.simulations = {}
                     st.success("✅ Analysis complete!")
                 except Exception as e:
                     st.error(f"Error during analysis: {str(e)}")
@@ -149,50 +230,31 @@ if uploaded_file is not None:
             st.subheader("Price Elasticity by Category")
             
             # Get results
-            results = st.session_state.model.elasticity_results.copy()
-            
-            # Color coding
-            results['color'] = results['elasticity'].apply(
-                lambda x: '#27ae60' if x < 1 else '#e74c3c'
-            )
+            results = st.session_state.model.elasticity_results
+            demand_counts, simple_counts = overview_counts(results)
             
             # Visualization
-            fig, ax = plt.subplots(figsize=(12, 8))
-            colors = ['#27ae60' if x < 1 else '#e74c3c' for x in results['elasticity']]
-            
-            bars = ax.barh(results['category'], results['elasticity'], color=colors, alpha=0.8)
-            ax.axvline(x=1, color='black', linestyle='--', linewidth=2, label='Unit Elastic (E = 1)')
-            ax.set_xlabel('Price Elasticity Coefficient', fontsize=12, fontweight='bold')
-            ax.set_ylabel('Product Category', fontsize=12, fontweight='bold')
-            ax.set_title('Price Elasticity by Product Category\nGreen = Price Increase Opportunity | Red = Price Sensitive',
-                        fontsize=14, fontweight='bold', pad=20)
-            ax.legend()
-            ax.grid(True, alpha=0.3, axis='x')
-            plt.tight_layout()
-            
-            st.pyplot(fig)
+            st.vega_lite_chart(elasticity_chart_spec(results), use_container_width=True)
             
             # Demand type distribution
             st.subheader("Demand Type Distribution")
             col1, col2 = st.columns(2)
             
             with col1:
-                demand_counts = results['demand_type'].value_counts()
-                fig2, ax2 = plt.subplots(figsize=(8, 6))
-                ax2.pie(demand_counts.values, labels=demand_counts.index, autopct='%1.1f%%',
-                       startangle=90, textprops={'fontsize': 10})
-                ax2.set_title('Demand Classification Distribution', fontweight='bold')
-                st.pyplot(fig2)
+                st.vega_lite_chart(
+                    pie_chart_spec(demand_counts, 'Demand Classification Distribution'),
+                    use_container_width=True
+                )
             
             with col2:
-                simple_counts = results['can_increase_price'].value_counts()
-                fig3, ax3 = plt.subplots(figsize=(8, 6))
-                colors_pie = ['#27ae60', '#e74c3c']
-                ax3.pie(simple_counts.values, labels=simple_counts.index, 
-                       autopct='%1.1f%%', colors=colors_pie, startangle=90,
-                       textprops={'fontsize': 10, 'fontweight': 'bold'})
-                ax3.set_title('Price Increase Opportunity', fontweight='bold')
-                st.pyplot(fig3)
+                st.vega_lite_chart(
+                    pie_chart_spec(
+                        simple_counts,
+                        'Price Increase Opportunity',
+                        colors={'Yes': '#27ae60', 'No': '#e74c3c'}
+                    ),
+                    use_container_width=True
+                )
         
         with tab2:
             st.subheader("💰 Pricing Opportunities (Inelastic Categories)")
@@ -249,10 +311,14 @@ if uploaded_file is not None:
                 )
             
             if st.button("Run Simulation"):
-                simulation = st.session_state.model.simulate_price_change(
-                    selected_category,
-                    price_change_pct=price_change / 100
-                )
+                # Reuse earlier runs of the same category and price change
+                key = (selected_category, price_change)
+                if key not in st.session_state.simulations:
+                    st.session_state.simulations[key] = st.session_state.model.simulate_price_change(
+                        selected_category,
+                        price_change_pct=price_change / 100
+                    )
+                simulation = st.session_state.simulations[key]
                 
                 if simulation:
                     st.subheader(f"Simulation Results: {simulation['category']}")
@@ -295,13 +361,13 @@ if uploaded_file is not None:
             st.subheader("📊 Detailed Results")
             
             # Full results table
-            results = st.session_state.model.elasticity_results.copy()
+            results = st.session_state.model.elasticity_results
             
             # Format for display
             display_results = results[[
                 'category', 'elasticity', 'p_value', 'r_squared',
                 'avg_price', 'total_sales', 'num_products', 'demand_type'
-            ]].copy()
+            ]]
             
             st.dataframe(
                 display_results.style.format({
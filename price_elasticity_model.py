@@ -5,9 +5,7 @@ Core module for calculating price elasticity of demand by product category
 
 import pandas as pd
 import numpy as np
-import statsmodels.api as sm
-import warnings
-warnings.filterwarnings('ignore')
+from scipy import special
 
 
 class PriceElasticityModel:
@@ -16,6 +14,10 @@ class PriceElasticityModel:
     def __init__(self):
         self.elasticity_results = None
         self.df = None
+        self._summary = None
+        self._inelastic = None
+        self._elastic = None
+        self._by_category = {}
         
     def load_data(self, filepath, price_col='Item_MRP', sales_col='Item_Outlet_Sales', 
                   category_col='Item_Type'):
@@ -33,7 +35,13 @@ class PriceElasticityModel:
         category_col : str
             Column name for product category
         """
-        self.df = pd.read_csv(filepath)
+        # Read only the columns the analysis needs, already typed
+        self.df = pd.read_csv(
+            filepath,
+            usecols=[price_col, sales_col, category_col],
+            dtype={price_col: 'float64', sales_col: 'float64', category_col: 'category'},
+            engine='pyarrow'
+        )
         
         # Rename columns for clarity
         self.df = self.df.rename(columns={
@@ -42,12 +50,23 @@ class PriceElasticityModel:
             category_col: 'category'
         })
         
-        # Clean data
+        # Clean data: keep finite, positive price and sales in a single pass
         original_size = len(self.df)
-        self.df = self.df.dropna(subset=['price', 'sales'])
-        self.df = self.df[(self.df['price'] > 0) & (self.df['sales'] > 0)]
+        price = self.df['price'].to_numpy()
+        sales = self.df['sales'].to_numpy()
+        valid = np.isfinite(price) & np.isfinite(sales) & (price > 0) & (sales > 0)
+        self.df = self.df.iloc[valid].reset_index(drop=True)
+        
+        removed_records = original_size - int(valid.sum())
         
-        removed_records = original_size - len(self.df)
+        # Log-log transformation, done once for the whole frame; categories
+        # are stored as codes so grouping hashes integers instead of strings,
+        # and categories emptied by cleaning are dropped to keep codes dense
+        self.df = self.df.assign(
+            category=self.df['category'].astype('category').cat.remove_unused_categories(),
+            log_price=np.log(self.df['price'].to_numpy()),
+            log_sales=np.log(self.df['sales'].to_numpy())
+        )
         
         return {
             'original_size': original_size,
@@ -69,84 +88,127 @@ class PriceElasticityModel:
         --------
         pd.DataFrame: Elasticity results by category
         """
-        elasticity_results = []
+        # Rows with a missing category carry code -1 and are left out
+        codes = self.df['category'].cat.codes.to_numpy()
+        keep = codes >= 0
+        codes = codes[keep]
+        categories = self.df['category'].cat.categories
+        log_price = self.df['log_price'].to_numpy()[keep]
+        log_sales = self.df['log_sales'].to_numpy()[keep]
         
-        for category in self.df['category'].unique():
-            cat_data = self.df[self.df['category'] == category].copy()
-            
-            if len(cat_data) < min_observations:
-                continue
-            
-            # Log-log transformation
-            cat_data['log_price'] = np.log(cat_data['price'])
-            cat_data['log_sales'] = np.log(cat_data['sales'])
-            
-            # Prepare regression
-            X = sm.add_constant(cat_data['log_price'])
-            y = cat_data['log_sales']
-            
-            try:
-                model = sm.OLS(y, X).fit()
-                elasticity = model.params['log_price']
-                p_value = model.pvalues['log_price']
-                r_squared = model.rsquared
-                
-                elasticity_results.append({
-                    'category': category,
-                    'elasticity': elasticity,
-                    'p_value': p_value,
-                    'r_squared': r_squared,
-                    'avg_price': cat_data['price'].mean(),
-                    'median_price': cat_data['price'].median(),
-                    'total_sales': cat_data['sales'].sum(),
-                    'num_products': len(cat_data)
-                })
-            except Exception as e:
-                print(f"[ERROR] {category}: Regression failed - {str(e)}")
-                continue
-        
-        self.elasticity_results = pd.DataFrame(elasticity_results)
+        # Per-category means, then moments of the centered data; each is a
+        # single pass over the category codes
+        n = np.bincount(codes, minlength=len(categories))
+        mean_x = np.bincount(codes, weights=log_price, minlength=len(categories)) / np.maximum(n, 1)
+        mean_y = np.bincount(codes, weights=log_sales, minlength=len(categories)) / np.maximum(n, 1)
+        dx = log_price - mean_x[codes]
+        dy = log_sales - mean_y[codes]
+        ssxm = np.bincount(codes, weights=dx * dx, minlength=len(categories))
+        ssym = np.bincount(codes, weights=dy * dy, minlength=len(categories))
+        ssxym = np.bincount(codes, weights=dx * dy, minlength=len(categories))
+        
+        # A slope needs n > 2 and real price variation; constant-price
+        # categories leave only rounding noise in ssxm
+        has_slope = (n > 2) & (ssxm > np.finfo(float).eps * (ssxm + n * mean_x * mean_x))
+        
+        # Likewise constant sales leave only rounding noise in ssym and ssxym;
+        # zero them so the slope is exactly 0, as scipy.stats.linregress does
+        flat_sales = ssym <= np.finfo(float).eps * (ssym + n * mean_y * mean_y)
+        ssym = np.where(flat_sales, 0.0, ssym)
+        ssxym = np.where(flat_sales, 0.0, ssxym)
+        
+        # Price and sales summaries in one grouped pass, reindexed so row i
+        # is the category with code i, lining up with the bincount arrays
+        category_stats = self.df.groupby('category', observed=False).agg(
+            avg_price=('price', 'mean'),
+            median_price=('price', 'median'),
+            total_sales=('sales', 'sum')
+        ).reindex(categories)
+        
+        selected = has_slope & (n >= min_observations)
+        category_stats = category_stats[selected]
+        categories = categories[selected]
+        num_products = n[selected]
+        n = num_products.astype(float)
+        ssxm, ssym, ssxym = ssxm[selected], ssym[selected], ssxym[selected]
+        
+        # Simple linear regression of log(sales) on log(price)
+        # Same centered-moment formulation as scipy.stats.linregress; selected
+        # categories all have price variation and n > 2, so no step divides by
+        # zero. Constant sales give slope 0, R-squared 0 and p-value 1; a perfect
+        # fit gives se 0, an infinite t statistic and p-value 0
+        beta = ssxym / ssxm
+        r_squared = np.clip(
+            np.divide(ssxym * ssxym, ssxm * ssym, out=np.zeros_like(ssym), where=ssym > 0), 0, 1
+        )
+        ss_res = ssym * (1 - r_squared)
+        se = np.sqrt(ss_res / (n - 2) / ssxm)
+        t_stat = np.divide(beta, se, out=np.where(beta == 0, 0.0, np.inf), where=se > 0)
+        p_value = 2 * special.stdtr(n - 2, -np.abs(t_stat))
+        
+        self.elasticity_results = pd.DataFrame({
+            'category': np.asarray(categories),
+            'elasticity': beta,
+            'p_value': p_value,
+            'r_squared': r_squared,
+            'avg_price': category_stats['avg_price'].to_numpy(),
+            'median_price': category_stats['median_price'].to_numpy(),
+            'total_sales': category_stats['total_sales'].to_numpy(),
+            'num_products': num_products
+        })
+        
+        # Compact dtypes for display; total sales stays float64 to keep cents exact
+        self.elasticity_results = self.elasticity_results.astype({
+            'category': 'string[pyarrow]',
+            'elasticity': 'float32',
+            'p_value': 'float32',
+            'r_squared': 'float32',
+            'avg_price': 'float32',
+            'median_price': 'float32',
+            'num_products': 'int32'
+        })
         self.elasticity_results = self.elasticity_results.sort_values('elasticity', ascending=False)
         
-        # Add classifications
-        self.elasticity_results['demand_type'] = self.elasticity_results['elasticity'].apply(
-            self._classify_demand
+        # Add classifications from the stored values, so labels, views and
+        # summary all agree on which side of 1 each category falls
+        elasticity = self.elasticity_results['elasticity'].to_numpy()
+        self.elasticity_results['demand_type'] = pd.Categorical(self._classify_demand(elasticity))
+        self.elasticity_results['can_increase_price'] = pd.Categorical(
+            np.where(elasticity > 1, 'No', 'Yes')
         )
-        self.elasticity_results['can_increase_price'] = self.elasticity_results['elasticity'].apply(
-            lambda x: 'No' if x > 1 else 'Yes'
+        
+        # Views used repeatedly by the dashboard, computed once per analysis
+        self._inelastic = self.elasticity_results[elasticity < 1].sort_values(
+            'avg_price', ascending=False
         )
+        self._elastic = self.elasticity_results[elasticity > 1].sort_values('elasticity')
+        self._summary = self._build_summary()
+        self._by_category = self.elasticity_results.set_index(
+            'category', drop=False
+        ).to_dict('index')
         
         return self.elasticity_results
     
     def _classify_demand(self, elasticity):
-        """Classify demand elasticity"""
-        abs_elasticity = abs(elasticity)
-        if abs_elasticity < 0.5:
-            return "Highly Inelastic"
-        elif abs_elasticity < 1:
-            return "Inelastic"
-        elif abs_elasticity == 1:
-            return "Unit Elastic"
-        elif abs_elasticity > 1 and abs_elasticity < 1.5:
-            return "Elastic"
-        else:
-            return "Highly Elastic"
+        """Classify demand elasticity (array of coefficients)"""
+        abs_elasticity = np.abs(elasticity)
+        return np.select(
+            [abs_elasticity < 0.5, abs_elasticity < 1, abs_elasticity == 1, abs_elasticity < 1.5],
+            ["Highly Inelastic", "Inelastic", "Unit Elastic", "Elastic"],
+            default="Highly Elastic"
+        )
     
     def get_inelastic_categories(self):
         """Get categories with inelastic demand (pricing opportunities)"""
         if self.elasticity_results is None:
             return pd.DataFrame()
-        return self.elasticity_results[self.elasticity_results['elasticity'] < 1].sort_values(
-            'avg_price', ascending=False
-        )
+        return self._inelastic
     
     def get_elastic_categories(self):
         """Get categories with elastic demand (price-sensitive)"""
         if self.elasticity_results is None:
             return pd.DataFrame()
-        return self.elasticity_results[self.elasticity_results['elasticity'] > 1].sort_values(
-            'elasticity'
-        )
+        return self._elastic
     
     def simulate_price_change(self, category, price_change_pct=0.05):
         """
@@ -166,14 +228,11 @@ class PriceElasticityModel:
         if self.elasticity_results is None:
             return None
         
-        category_data = self.elasticity_results[
-            self.elasticity_results['category'] == category
-        ]
+        row = self._by_category.get(category)
         
-        if len(category_data) == 0:
+        if row is None:
             return None
         
-        row = category_data.iloc[0]
         elasticity = row['elasticity']
         
         # Calculate expected quantity change
@@ -201,18 +260,25 @@ class PriceElasticityModel:
         """Get summary statistics"""
         if self.elasticity_results is None:
             return None
+        return self._summary
+    
+    def _build_summary(self):
+        """Reduce elasticity results to summary statistics"""
+        elasticity = self.elasticity_results['elasticity'].to_numpy()
+        p_value = self.elasticity_results['p_value'].to_numpy()
+        r_squared = self.elasticity_results['r_squared'].to_numpy()
         
-        inelastic_count = (self.elasticity_results['elasticity'] < 1).sum()
-        total_count = len(self.elasticity_results)
+        inelastic_count = np.count_nonzero(elasticity < 1)
+        total_count = len(elasticity)
         
         return {
             'total_categories': total_count,
             'inelastic_categories': inelastic_count,
             'elastic_categories': total_count - inelastic_count,
             'inelastic_pct': (inelastic_count / total_count * 100) if total_count > 0 else 0,
-            'avg_elasticity': self.elasticity_results['elasticity'].mean(),
-            'significant_results': (self.elasticity_results['p_value'] < 0.05).sum(),
-            'avg_r_squared': self.elasticity_results['r_squared'].mean()
+            'avg_elasticity': elasticity.mean() if total_count > 0 else np.nan,
+            'significant_results': np.count_nonzero(p_value < 0.05),
+            'avg_r_squared': r_squared.mean() if total_count > 0 else np.nan
         }
     
     def get_correlation(self):